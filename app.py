@@ -4,18 +4,18 @@ FastHTML Todo App - Complete Integration Example
 Demonstrates fasthtml-auth integration with built-in admin interface
 """
 
-from fasthtml.common import *
-from monsterui.all import *
+from fasthtml.common import FastHTML, serve
 from fasthtml_auth import AuthManager
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.routing import Route
+import importlib
+import logging
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Local imports
-from models import TodoDatabase, Todo
-from routes.public import register_public_routes
-from routes.todos import register_todo_routes  
-from routes.admin import register_todo_admin_routes
-
 # Configuration
 BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / "data"
@@ -28,9 +28,49 @@ APP_CONFIG = {
     'port': 5001
 }
 
+# Per-request debug/security messages go through logging; set LOG_LEVEL=DEBUG to see them
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'WARNING'), format="%(levelname)s %(name)s: %(message)s")
+
+@lru_cache(maxsize=1)
+def theme_headers():
+    """MonsterUI blue theme headers, generated once per process and reused"""
+    from monsterui.all import Theme
+    return tuple(Theme.blue.headers())
+
+class LazyRoutes:
+    """
+    ASGI placeholder for a rarely used route module.
+    On the first matching request it imports the module, registers its real
+    routes on the app, removes itself and re-dispatches the request.
+    """
+    def __init__(self, app, module, register, *args):
+        self.app = app
+        self.module = module
+        self.register = register
+        self.args = args
+        self.route = None
+    
+    def mount(self, path):
+        self.route = Route(path, self)
+        self.app.router.routes.append(self.route)
+    
+    async def __call__(self, scope, receive, send):
+        # Registration is synchronous, so concurrent first requests cannot interleave here
+        if self.route in self.app.router.routes:
+            self.app.router.routes.remove(self.route)
+            register = getattr(importlib.import_module(self.module), self.register)
+            register(self.app, *self.args)
+            print(f"🔧 Loaded {self.module} routes on first use")
+        await self.app.router(scope, receive, send)
+
 def create_app():
     """Create and configure the FastHTML application"""
-    
+    # Heavy UI/route modules are imported here rather than at module level
+    from models import TodoDatabase
+    from components import ConfirmScript
+    from routes.public import register_public_routes
+    from routes.todos import register_todo_routes
+
     # Initialize Authentication System with built-in admin
     auth_config = {
         'allow_registration': True,
@@ -60,7 +100,9 @@ def create_app():
     app = FastHTML(
         before=beforeware,
         secret_key=APP_CONFIG['secret_key'],
-        hdrs=Theme.blue.headers()  # MonsterUI Blue Theme
+        hdrs=(*theme_headers(), ConfirmScript()),  # MonsterUI Blue Theme + data-confirm handler
+        middleware=[Middleware(GZipMiddleware, minimum_size=1000)],  # Class-heavy HTML compresses well
+        on_shutdown=[todo_db.close]  # Release pooled SQLite connections
     )
     
     # Register authentication routes with built-in admin interface
@@ -71,17 +113,42 @@ def create_app():
     print("🔧 Registering application routes...")
     register_public_routes(app)
     register_todo_routes(app, auth, todo_db)
-    register_todo_admin_routes(app, auth, todo_db)  # Only todo-specific admin features
+    # Todo admin features are loaded on the first /admin request
+    LazyRoutes(app, "routes.admin", "register_todo_admin_routes", auth, todo_db).mount("/admin/{path:path}")
     
     print("✅ Application initialized successfully!")
     print("📋 Built-in admin interface enabled at /auth/admin")
     return app, auth, todo_db
 
-# Module-level app variable for uvicorn
-app, auth, todo_db = create_app()
+@lru_cache(maxsize=1)
+def get_app():
+    """The app with its AuthManager and TodoDatabase, created on first call"""
+    return create_app()
+
+# Module-level app/auth/todo_db for uvicorn ("app:app") are built on first access,
+# so `import app` stays cheap and `python app.py` does not build an app in the process
+# that only hands "app:app" to uvicorn
+def __getattr__(name):
+    if name in ('app', 'auth', 'todo_db'):
+        return dict(zip(('app', 'auth', 'todo_db'), get_app()))[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def seed():
+    """Create demo users and todos once (python app.py --seed)"""
+    print("🌱 Seeding demo data...")
+    _, auth, todo_db = get_app()
+    create_demo_data(auth, todo_db)
+
+def serve_app():
+    """Start the web server"""
+    serve(port=APP_CONFIG['port'])
 
 def main():
     """Main application entry point"""
+    if "--seed" in sys.argv:
+        seed()
+        return
+
     print("🚀 Starting FastHTML Todo App with Built-in Authentication Admin")
     print("=" * 60)
     
@@ -103,15 +170,16 @@ def main():
    • Password: admin123
    • Role: admin
    
-👥 Demo Users (created automatically):
+👥 Demo Users (run `python app.py --seed` or set SEED_DEMO=1):
    • Username: demo_user / Password: demo123 (role: user)
    • Username: demo_manager / Password: demo123 (role: manager)
         """)
         
-        # Create demo data
-        create_demo_data(auth, todo_db)
+        # Demo data is a one-off step, not part of every boot
+        if os.getenv("SEED_DEMO") == "1":
+            seed()
         
-        serve(port=APP_CONFIG['port'])
+        serve_app()
         
     except Exception as e:
         print(f"❌ Failed to start application: {e}")
@@ -127,27 +195,37 @@ def create_demo_data(auth, todo_db):
             ('demo_manager', 'manager@example.com', 'demo123', 'manager'),
         ]
         
+        sample_todos = [
+            "Learn FastHTML framework",
+            "Integrate authentication system",
+            "Build todo application",
+            "Deploy to production"
+        ]
+
+        # Collect all demo todos and insert them in one transaction
+        # (users live in the auth repo's own connection, so they are created first)
+        todo_rows = []
+        existing = todo_db.existing_usernames([u[0] for u in demo_users])
         for username, email, password, role in demo_users:
-            if not auth.get_user(username):
+            if username not in existing:
                 user = auth.user_repo.create(username, email, password, role)
                 print(f"👤 Created demo user: {username} ({role})")
-                
+
                 # Add sample todos for demo users
                 if role == 'user':
-                    sample_todos = [
-                        "Learn FastHTML framework",
-                        "Integrate authentication system", 
-                        "Build todo application",
-                        "Deploy to production"
-                    ]
-                    for i, title in enumerate(sample_todos):
-                        todo_db.create_todo(
-                            user_id=user.id,
-                            title=title,
-                            description=f"Demo todo #{i+1} for user {username}",
-                            completed=(i % 3 == 0)  # Some completed
-                        )
-                        
+                    todo_rows.extend(
+                        {
+                            'user_id': user.id,
+                            'title': title,
+                            'description': f"Demo todo #{i+1} for user {username}",
+                            'completed': (i % 3 == 0)  # Some completed
+                        }
+                        for i, title in enumerate(sample_todos)
+                    )
+
+        if todo_rows:
+            todo_db.bulk_create_todos(todo_rows)
+
     except Exception as e:
         print(f"⚠️ Demo data creation failed: {e}")
 
@@ -6,6 +6,10 @@ User management components removed - now handled by fasthtml-auth built-in admin
 
 from fasthtml.common import *
 from monsterui.all import *
+from functools import lru_cache
+from html import escape
+from types import SimpleNamespace
+import re
 
 class ComponentStyles:
     """Centralized styling constants"""
@@ -28,6 +32,28 @@ class ComponentStyles:
         'manager': 'text-blue-700 bg-blue-100',
         'user': 'text-gray-700 bg-gray-100'
     }
+    
+    # Full badge class strings, built once at import time
+    PRIORITY_BADGE_CLS = {k: f"text-xs px-2 py-1 rounded border {v}" for k, v in PRIORITY_COLORS.items()}
+    STATUS_BADGE_CLS = {k: f"text-xs px-2 py-1 rounded {v}" for k, v in STATUS_COLORS.items()}
+    ROLE_BADGE_CLS = {k: f"text-xs px-2 py-1 rounded {v}" for k, v in ROLE_COLORS.items()}
+
+# Per-state class strings for todo cards, selected rather than formatted per todo
+_TITLE_DONE = "text-lg font-medium line-through text-muted-foreground"
+_TITLE_OPEN = "text-lg font-medium"
+_CARD_DONE = "opacity-60"
+_CARD_OPEN = ""
+_TOGGLE_DONE_CLS = (ButtonT.secondary, "mr-2")
+_TOGGLE_OPEN_CLS = (ButtonT.primary, "mr-2")
+
+# Lookup tables used by ActionButtons / AlertMessage
+_ALIGN_CLS = {'left': 'justify-start', 'right': 'justify-end', 'center': 'justify-center'}
+_ALERT_CLS = {
+    'success': AlertT.success,
+    'error': AlertT.error,
+    'warning': AlertT.warning,
+    'info': AlertT.info
+}
 
 def AppLayout(title, user=None, nav_type="public", *content, **kwargs):
     """
@@ -39,23 +65,109 @@ def AppLayout(title, user=None, nav_type="public", *content, **kwargs):
         nav_type: "public", "dashboard", or "admin"
         *content: Page content
     """
-    nav_component = {
-        "public": PublicNav(),
-        "dashboard": DashboardNav(user) if user else PublicNav(),
-        "admin": AdminNav(user) if user else PublicNav()
-    }.get(nav_type, PublicNav())
-    
+    # Build only the navigation that is actually shown
+    if nav_type == "dashboard" and user:
+        nav_component = DashboardNav(user)
+    elif nav_type == "admin" and user:
+        nav_component = AdminNav(user)
+    else:
+        nav_component = PublicNav()
+
     return Title(title), nav_component, *content
 
+# Streaming pages: render the page chrome once, then send list rows as they are produced
+
+_STREAM_SLOT = "<!--stream-slot-->"
+_HEAD_TAGS = ('title', 'meta', 'link', 'style', 'base')
+
+def StreamSlot():
+    """Marks where streamed rows are inserted in a page passed to stream_page"""
+    return NotStr(_STREAM_SLOT)
+
+def render_page_parts(req, page):
+    """
+    Render a full page (with the app's hdrs) and split it at the StreamSlot
+    HTMX requests get just the fragment, as FastHTML does for ordinary handlers
+    
+    Returns:
+        (head, tail) HTML strings - head is everything before the slot
+    """
+    page = tuple(page) if isinstance(page, (tuple, list)) else (page,)
+    if 'hx-request' in req.headers and 'hx-history-restore-request' not in req.headers:
+        html = to_xml(page)
+    else:
+        heads = [o for o in page if getattr(o, 'tag', '') in _HEAD_TAGS]
+        if getattr(req.app, 'canonical', False):
+            heads.append(Link(rel="canonical", href=str(req.url).replace('http://', 'https://', 1)))
+        body = tuple(o for o in page if getattr(o, 'tag', '') not in _HEAD_TAGS)
+        html = to_xml(respond(req, heads, body))
+    head, _, tail = html.partition(_STREAM_SLOT)
+    return head, tail
+
+def stream_page(req, page, rows):
+    """
+    Stream a page: the markup before StreamSlot(), then each row, then the rest
+    
+    Args:
+        req: Current request (supplies the app headers)
+        page: Usual handler return value containing a StreamSlot()
+        rows: Iterable of HTML strings or FT components
+    """
+    head, tail = render_page_parts(req, page)
+
+    def body():
+        yield head
+        for row in rows:
+            yield row if isinstance(row, str) else to_xml(row)
+        yield tail
+
+    return StreamingResponse(body(), media_type="text/html")
+
+def fill_slot(main, rows):
+    """Render `main` as one HTML string with `rows` (as for stream_page) at its StreamSlot()"""
+    before, _, after = to_xml(main).partition(_STREAM_SLOT)
+    return before + ''.join(row if isinstance(row, str) else to_xml(row) for row in rows) + after
+
+def stream_page_deferred(req, shell, content):
+    """
+    Stream a page whose main content needs slow work (e.g. database reads)
+    The document head and `shell` are sent before that work starts
+    
+    Args:
+        req: Current request (supplies the app headers)
+        shell: Title/nav with a StreamSlot() where the main content goes
+        content: Async function returning (main, rows) - main is the content
+                 component or HTML string (with its own StreamSlot() if it has rows),
+                 rows as for stream_page
+    """
+    head, tail = render_page_parts(req, shell)
+
+    async def body():
+        yield head
+        main, rows = await content()
+        before, _, after = (main if isinstance(main, str) else to_xml(main)).partition(_STREAM_SLOT)
+        yield before
+        for row in rows:
+            yield row if isinstance(row, str) else to_xml(row)
+        yield after
+        yield tail
+
+    return StreamingResponse(body(), media_type="text/html")
+
 def PublicNav():
-    """Navigation for public pages"""
-    return NavBar(
+    """Navigation for public pages (identical for every visitor, so rendered once)"""
+    return NotStr(_public_nav_html())
+
+@lru_cache(maxsize=1)
+def _public_nav_html():
+    """Serialized PublicNav markup"""
+    return to_xml(NavBar(
         A("Features", href="/features"),
         A("About", href="/about"),
         A("Sign In", href="/auth/login", cls=ButtonT.primary),
         A("Register", href="/auth/register", cls=ButtonT.secondary),
         brand=A("📝 FastHTML Todo", href="/")
-    )
+    ))
 
 def DashboardNav(user):
     """Navigation for user dashboard"""
@@ -123,19 +235,19 @@ def StatusBadge(status, custom_text=None):
         custom_text: Override display text
     """
     text = custom_text or status.title()
-    color_class = ComponentStyles.STATUS_COLORS.get(status, ComponentStyles.STATUS_COLORS['pending'])
+    badge_cls = ComponentStyles.STATUS_BADGE_CLS
     
-    return Span(text, cls=f"text-xs px-2 py-1 rounded {color_class}")
+    return Span(text, cls=badge_cls.get(status, badge_cls['pending']))
 
 def PriorityBadge(priority):
     """Priority badge for todos"""
-    color_class = ComponentStyles.PRIORITY_COLORS.get(priority, ComponentStyles.PRIORITY_COLORS['medium'])
-    return Span(priority.title(), cls=f"text-xs px-2 py-1 rounded border {color_class}")
+    badge_cls = ComponentStyles.PRIORITY_BADGE_CLS
+    return Span(priority.title(), cls=badge_cls.get(priority, badge_cls['medium']))
 
 def RoleBadge(role):
     """Role badge for users"""
-    color_class = ComponentStyles.ROLE_COLORS.get(role, ComponentStyles.ROLE_COLORS['user'])
-    return Span(role.title(), cls=f"text-xs px-2 py-1 rounded {color_class}")
+    badge_cls = ComponentStyles.ROLE_BADGE_CLS
+    return Span(role.title(), cls=badge_cls.get(role, badge_cls['user']))
 
 def TodoCard(todo, user_id=None, show_user=False):
     """
@@ -160,7 +272,7 @@ def TodoCard(todo, user_id=None, show_user=False):
                     DivFullySpaced(
                         H3(
                             todo.title,
-                            cls=f"text-lg font-medium {'line-through text-muted-foreground' if is_completed else ''}"
+                            cls=_TITLE_DONE if is_completed else _TITLE_OPEN
                         ),
                         PriorityBadge(priority)
                     ),
@@ -182,9 +294,57 @@ def TodoCard(todo, user_id=None, show_user=False):
                 cls="flex justify-between items-start gap-4"
             )
         ),
-        cls=f"{'opacity-60' if is_completed else ''}"
+        cls=_CARD_DONE if is_completed else _CARD_OPEN
     )
 
+# Fast path for long todo lists: render each card shape once, then fill in values
+
+_SLOT_FIELDS = ('id', 'title', 'description', 'due_date')
+_SLOT_RE = re.compile(r'__SLOT_(\w+)__')
+
+@lru_cache(maxsize=64)
+def _todo_template(component, completed, has_description, has_due_date, priority):
+    """
+    Render `component` once with placeholder values and turn it into a %-format string
+    One template per card shape (completed/description/due date/priority)
+    """
+    placeholder = SimpleNamespace(
+        id='__SLOT_id__',
+        user_id=None,
+        title='__SLOT_title__',
+        description='__SLOT_description__' if has_description else '',
+        due_date='__SLOT_due_date__' if has_due_date else None,
+        completed=completed,
+        priority=priority
+    )
+    return slot_template(component(placeholder))
+
+def slot_template(component):
+    """Serialize `component` as a %-format string, turning each __SLOT_name__ into a %(name)s slot"""
+    # No indentation: templates are repeated per row/request, so their whitespace would be too
+    parts = _SLOT_RE.split(to_xml(component, indent=False))
+    # Even indexes are literal markup, odd indexes are slot names
+    return ''.join(
+        part.replace('%', '%%') if i % 2 == 0 else f'%({part})s'
+        for i, part in enumerate(parts)
+    )
+
+def iter_todos_html(todos, component=None):
+    """
+    Yield one HTML string per todo, bypassing per-todo component construction
+    
+    Args:
+        todos: Iterable of todo objects
+        component: Single-todo component used to build the templates (default TodoCard)
+    """
+    component = component or TodoCard
+    for todo in todos:
+        template = _todo_template(
+            component, bool(todo.completed), bool(todo.description),
+            bool(todo.due_date), todo.priority
+        )
+        yield template % {field: escape(str(getattr(todo, field))) for field in _SLOT_FIELDS}
+
 def TodoActions(todo):
     """Action buttons for todo items"""
     return Div(
@@ -192,7 +352,7 @@ def TodoActions(todo):
             Button(
                 "✓" if not todo.completed else "↶",
                 type="submit",
-                cls=(ButtonT.success if not todo.completed else ButtonT.secondary, "mr-2"),
+                cls=_TOGGLE_DONE_CLS if todo.completed else _TOGGLE_OPEN_CLS,
                 title="Toggle completion"
             ),
             method="post",
@@ -203,8 +363,8 @@ def TodoActions(todo):
             Button(
                 "Delete",
                 type="submit",
-                cls=ButtonT.danger,
-                onclick="return confirm('Delete this todo?')"
+                cls=ButtonT.destructive,
+                data_confirm="Delete this todo?"
             ),
             method="post",
             action=f"/todos/{todo.id}/delete",
@@ -221,13 +381,19 @@ def FilterTabs(current_filter="all", base_url="/dashboard"):
         current_filter: Currently active filter
         base_url: Base URL for filter links
     """
+    # Only a handful of (filter, url) combinations exist, so reuse the rendered HTML
+    return NotStr(_filter_tabs_html(current_filter, base_url))
+
+@lru_cache(maxsize=32)
+def _filter_tabs_html(current_filter, base_url):
+    """Render FilterTabs once per (current_filter, base_url) pair"""
     filters = [
         ("all", "All"),
         ("pending", "Pending"),
         ("completed", "Completed")
     ]
     
-    return Div(
+    return to_xml(Div(
         *[
             A(
                 label,
@@ -237,7 +403,7 @@ def FilterTabs(current_filter="all", base_url="/dashboard"):
             for filter_key, label in filters
         ],
         cls="flex border-b border-border mb-6"
-    )
+    ))
 
 def EmptyState(message, action_text=None, action_href=None, icon="📝"):
     """
@@ -270,17 +436,22 @@ def DataTable(headers, rows, table_id=None):
     
     Args:
         headers: List of header strings
-        rows: List of row data (each row is a list of cells)
+        rows: List of row data - either all cell lists or all prebuilt Tr elements
         table_id: Optional table ID
     """
+    # Rows are homogeneous: decide once whether they need wrapping in Tr
+    rows = list(rows)
+    if rows and isinstance(rows[0], (list, tuple)):
+        body_rows = map(lambda row: Tr(*row), rows)
+    else:
+        body_rows = rows
+    
     return Div(
         Table(
             Thead(
-                Tr(*[Th(header) for header in headers])
-            ),
-            Tbody(
-                *[Tr(*row) if isinstance(row, (list, tuple)) else row for row in rows]
+                Tr(*map(Th, headers))
             ),
+            Tbody(*body_rows),
             id=table_id,
             cls="w-full"
         ),
@@ -311,11 +482,7 @@ def ActionButtons(*buttons, alignment="right"):
         *buttons: Button elements
         alignment: 'left', 'right', 'center'
     """
-    align_class = {
-        'left': 'justify-start',
-        'right': 'justify-end', 
-        'center': 'justify-center'
-    }.get(alignment, 'justify-end')
+    align_class = _ALIGN_CLS.get(alignment, 'justify-end')
     
     return Div(
         *buttons,
@@ -338,7 +505,7 @@ def ConfirmButton(text, action, method="post", confirm_message="Are you sure?",
             text,
             type="submit",
             cls=button_style,
-            onclick=f"return confirm('{confirm_message}')"
+            data_confirm=confirm_message  # Handled by ConfirmScript
         ),
         method=method,
         action=action,
@@ -388,6 +555,18 @@ def LoadingSpinner(text="Loading..."):
         cls="py-8"
     )
 
+def ConfirmScript():
+    """
+    One delegated submit handler for every button with a data-confirm attribute
+    Include once in the app hdrs instead of inline onclick handlers per button
+    """
+    return Script(
+        "document.addEventListener('submit', e => {"
+        " const b = e.submitter;"
+        " if (b && b.dataset.confirm && !confirm(b.dataset.confirm)) e.preventDefault();"
+        "});"
+    )
+
 def AlertMessage(message, type="info", dismissible=False):
     """
     Alert message component
@@ -397,14 +576,7 @@ def AlertMessage(message, type="info", dismissible=False):
         type: Alert type ('success', 'error', 'warning', 'info')
         dismissible: Whether alert can be dismissed
     """
-    alert_classes = {
-        'success': AlertT.success,
-        'error': AlertT.error,
-        'warning': AlertT.warning,
-        'info': AlertT.info
-    }
-    
-    alert_class = alert_classes.get(type, AlertT.info)
+    alert_class = _ALERT_CLS.get(type, AlertT.info)
     
     if dismissible:
         return Alert(
@@ -417,8 +589,9 @@ def AlertMessage(message, type="info", dismissible=False):
     else:
         return Alert(message, cls=alert_class)
 
-# Utility functions for common patterns
+# Utility functions for common patterns (pure, so results are memoized)
 
+@lru_cache(maxsize=2048)
 def format_date(date_string, format="short"):
     """Format date string for display"""
     if not date_string:
@@ -431,6 +604,7 @@ def format_date(date_string, format="short"):
     else:
         return date_string
 
+@lru_cache(maxsize=2048)
 def format_completion_rate(completed, total):
     """Format completion percentage"""
     if total == 0:
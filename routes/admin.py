@@ -6,36 +6,132 @@ User management is now handled by fasthtml-auth built-in admin interface
 
 from fasthtml.common import *
 from monsterui.all import *
-from datetime import datetime
+from functools import lru_cache, wraps
+from urllib.parse import urlencode
+import time
+from components import stream_page, StreamSlot
+
+# Rows per page on /admin/todos (?per_page= may override, up to the max)
+ADMIN_TODOS_PER_PAGE = 100
+ADMIN_TODOS_MAX_PER_PAGE = 500
+
+# System-wide stats are an aggregate over every todo; admin figures may be this many seconds old
+SYSTEM_STATS_TTL = 15
+
+# ?success= / ?error= codes shown on /admin/todos
+TODO_MGMT_MESSAGES = {
+    'todo_deleted': 'Todo deleted successfully',
+}
+TODO_MGMT_ERRORS = {
+    'delete_failed': 'Todo could not be deleted',
+}
+
+# Full badge class strings, selected per row instead of formatted per row
+_BADGE = "text-xs px-2 py-1 rounded"
+STATUS_CLASS = {
+    True: f"{_BADGE} text-green-700 bg-green-100",
+    False: f"{_BADGE} text-yellow-700 bg-yellow-100"
+}
+PRIORITY_CLASS = {
+    'high': f"{_BADGE} text-red-600 bg-red-50",
+    'medium': f"{_BADGE} text-yellow-600 bg-yellow-50",
+    'low': f"{_BADGE} text-green-600 bg-green-50"
+}
+_TAB = "px-4 py-2 border-b-2 font-medium transition-colors"
+TAB_CLASS = {
+    True: f"{_TAB} border-primary text-primary",
+    False: f"{_TAB} border-transparent text-muted-foreground hover:text-foreground"
+}
+
+def ttl_cache(seconds):
+    """Cache a zero-argument function's result for `seconds`; wrapper.cache_clear() drops it early"""
+    def decorator(fn):
+        state = {}
+        
+        @wraps(fn)
+        def wrapper():
+            now = time.monotonic()
+            if 'value' not in state or now - state['at'] > seconds:
+                state['value'], state['at'] = fn(), now
+            return state['value']
+        
+        wrapper.cache_clear = state.clear
+        return wrapper
+    return decorator
 
 def register_todo_admin_routes(app, auth, todo_db):
     """Register todo-specific admin routes (user management now built-in)"""
     
-    @app.route("/admin/todos")
-    @auth.require_admin()
-    def all_todos_management(req):
-        """View and manage all todos across users"""
-        user = req.scope['user']
+    @ttl_cache(seconds=SYSTEM_STATS_TTL)
+    def cached_system_stats():
+        return todo_db.get_system_stats()
+    
+    def query_todos(req):
+        """Todos for the current /admin/todos query string, plus the older/newest page links"""
         filter_type = req.query_params.get('filter', 'all')
+        per_page_param = req.query_params.get('per_page', '')
+        per_page = (min(int(per_page_param), ADMIN_TODOS_MAX_PER_PAGE)
+                    if per_page_param.isdigit() and int(per_page_param) > 0 else ADMIN_TODOS_PER_PAGE)
+        
+        # Keyset cursor: (created_at, id) of the last row on the previous page
+        before_id = req.query_params.get('before_id', '')
+        before = req.query_params.get('before')
+        cursor = (before, int(before_id)) if before and before_id.isdigit() else None
         
         # Get todos based on filter
         if filter_type == 'completed':
-            all_todos = todo_db.get_all_todos_admin(completed=True, limit=100)
+            all_todos = todo_db.get_all_todos_admin(completed=True, limit=per_page, before=cursor)
         elif filter_type == 'pending':
-            all_todos = todo_db.get_all_todos_admin(completed=False, limit=100)
+            all_todos = todo_db.get_all_todos_admin(completed=False, limit=per_page, before=cursor)
         else:
-            all_todos = todo_db.get_all_todos_admin(limit=100)
+            all_todos = todo_db.get_all_todos_admin(limit=per_page, before=cursor)
+        
+        # A full page means there may be older todos
+        next_url = None
+        if len(all_todos) == per_page:
+            last = all_todos[-1]
+            next_url = "/admin/todos?" + urlencode({'filter': filter_type, 'per_page': per_page,
+                                                    'before': last[4], 'before_id': last[0]})
+        
+        newest_url = "/admin/todos?" + urlencode({'filter': filter_type, 'per_page': per_page}) if cursor else None
         
+        return all_todos, filter_type, next_url, newest_url
+    
+    @app.route("/admin/todos")
+    @auth.require_admin()
+    def all_todos_management(req):
+        """View and manage all todos across users"""
+        user = req.scope['user']
+        all_todos, filter_type, next_url, newest_url = query_todos(req)
         success = req.query_params.get('success')
+        error = req.query_params.get('error')
+        
+        # Stream the table rows into the rendered page, so the head and nav go out first
+        return stream_page(
+            req,
+            render_todos_management(user, all_todos, filter_type, success, error,
+                                    next_url=next_url, newest_url=newest_url),
+            map(admin_todo_row, all_todos)
+        )
+    
+    @app.route("/admin/todos/rows")
+    @auth.require_admin()
+    def all_todos_panel(req):
+        """Filter tabs and todos table only - swapped in by the FilterTabs hx-get"""
+        all_todos, filter_type, next_url, newest_url = query_todos(req)
         
-        return render_todos_management(user, all_todos, filter_type, success)
+        return stream_page(
+            req,
+            TodosPanel(all_todos, filter_type, next_url=next_url, newest_url=newest_url),
+            map(admin_todo_row, all_todos)
+        )
     
     @app.route("/admin/system")
     @auth.require_admin()
     def system_info(req):
         """Todo-specific system information and statistics"""
         user = req.scope['user']
-        system_stats = todo_db.get_system_stats()
+        system_stats = cached_system_stats()
         
         return render_system_info(user, system_stats)
     
@@ -46,16 +142,17 @@ def register_todo_admin_routes(app, auth, todo_db):
         success = todo_db.admin_delete_todo(todo_id)
         
         if success:
+            cached_system_stats.cache_clear()
             return RedirectResponse('/admin/todos?success=todo_deleted', status_code=303)
         else:
             return RedirectResponse('/admin/todos?error=delete_failed', status_code=303)
 
-def render_todos_management(user, all_todos, filter_type='all', success=None):
+def render_todos_management(user, all_todos, filter_type='all', success=None, error=None,
+                            next_url=None, newest_url=None):
     """Render todos management page"""
-    # Success messages
-    messages = {
-        'todo_deleted': 'Todo deleted successfully',
-    }
+    # Only known codes produce an alert; anything else renders nothing
+    success_alert = Alert(TODO_MGMT_MESSAGES[success], cls=AlertT.success) if success in TODO_MGMT_MESSAGES else None
+    error_alert = Alert(TODO_MGMT_ERRORS[error], cls=AlertT.error) if error in TODO_MGMT_ERRORS else None
     
     return Title("All Todos - Admin"), \
         TodoAdminNav(user), \
@@ -68,31 +165,47 @@ def render_todos_management(user, all_todos, filter_type='all', success=None):
                 A("← Back to Built-in Admin", href="/auth/admin", cls=ButtonT.secondary)
             ),
             
-            Alert(messages.get(success), cls=AlertT.success) if success else None,
+            success_alert,
+            error_alert,
             
-            # Filter Tabs
-            FilterTabs(filter_type, "/admin/todos"),
-            
-            Card(
-                CardHeader(
-                    DivFullySpaced(
-                        H2("All User Todos"),
-                        P(f"{len(all_todos)} todos found", cls="text-muted-foreground")
-                    )
-                ),
-                CardBody(
-                    admin_todos_table(all_todos) if all_todos else
-                    P("No todos found.", cls="text-muted-foreground text-center py-8")
-                ),
-                cls="mt-6"
-            ),
+            TodosPanel(all_todos, filter_type, next_url=next_url, newest_url=newest_url),
             
             cls=ContainerT.xl
         )
 
+def TodosPanel(all_todos, filter_type='all', next_url=None, newest_url=None):
+    """Filter tabs plus the todos card - the part of the page FilterTabs swaps via HTMX"""
+    return Div(
+        FilterTabs(filter_type, "/admin/todos"),
+        
+        Card(
+            CardHeader(
+                DivFullySpaced(
+                    H2("All User Todos"),
+                    P(f"{len(all_todos)} todos found", cls="text-muted-foreground")
+                )
+            ),
+            CardBody(
+                admin_todos_table(all_todos) if all_todos else
+                P("No todos found.", cls="text-muted-foreground text-center py-8")
+            ),
+            CardFooter(
+                DivFullySpaced(
+                    A("← Newest", href=newest_url, cls=ButtonT.ghost) if newest_url else Span(),
+                    A("Older →", href=next_url, cls=ButtonT.ghost) if next_url else Span()
+                )
+            ) if newest_url or next_url else None,
+            cls="mt-6"
+        ),
+        id="admin-todos"
+    )
+
 def render_system_info(user, system_stats):
     """Render system information page"""
     todo_stats = system_stats.get('todo_stats', {})
+    total = todo_stats.get('total', 0)
+    completed = todo_stats.get('completed', 0)
+    rate = completed / total * 100 if total else 0.0
     
     return Title("System Information - Admin"), \
         TodoAdminNav(user), \
@@ -104,12 +217,10 @@ def render_system_info(user, system_stats):
             
             # Todo Statistics Overview
             Grid(
-                AdminStatsCard("Total Todos", sum(todo_stats.values()), "📝"),
-                AdminStatsCard("Completed", todo_stats.get('completed', 0), "✅"),
+                AdminStatsCard("Total Todos", total, "📝"),
+                AdminStatsCard("Completed", completed, "✅"),
                 AdminStatsCard("Pending", todo_stats.get('pending', 0), "⏳"),
-                AdminStatsCard("Completion Rate", 
-                             f"{(todo_stats.get('completed', 0) / sum(todo_stats.values()) * 100) if sum(todo_stats.values()) > 0 else 0:.1f}%", 
-                             "📊"),
+                AdminStatsCard("Completion Rate", f"{rate:.1f}%", "📊"),
                 cols=2, cols_md=4, cls="gap-4 mb-8"
             ),
             
@@ -149,9 +260,8 @@ def admin_todos_table(todos):
                     Th("Actions")
                 )
             ),
-            Tbody(
-                *[admin_todo_row(todo) for todo in todos]
-            ),
+            # Rows are streamed here by the admin todos route (see stream_page)
+            Tbody(StreamSlot()),
             cls="w-full text-sm"
         ),
         cls="overflow-x-auto"
@@ -159,33 +269,23 @@ def admin_todos_table(todos):
 
 def admin_todo_row(todo):
     """Individual todo row for admin table"""
-    status_badge = Span(
-        "Done" if todo[3] else "Pending",
-        cls=f"text-xs px-2 py-1 rounded {'text-green-700 bg-green-100' if todo[3] else 'text-yellow-700 bg-yellow-100'}"
-    )
-    
-    priority_colors = {
-        'high': 'text-red-600 bg-red-50',
-        'medium': 'text-yellow-600 bg-yellow-50', 
-        'low': 'text-green-600 bg-green-50'
-    }
-    priority_class = priority_colors.get(todo[4], priority_colors['medium'])
-    priority_badge = Span(todo[4].title(), cls=f"text-xs px-2 py-1 rounded {priority_class}")
+    status_badge = Span("Done" if todo[2] else "Pending", cls=STATUS_CLASS[bool(todo[2])])
+    priority_badge = Span(todo[3].title(), cls=PRIORITY_CLASS.get(todo[3], PRIORITY_CLASS['medium']))
     
     return Tr(
-        Td(todo[1][:50] + "..." if len(todo[1]) > 50 else todo[1]),  # title
+        Td(todo[1]),  # title, truncated in SQL
         Td(todo[6]),  # username
         Td(todo[7]),  # email
         Td(status_badge),
         Td(priority_badge),
-        Td(todo[5][:10]),  # created_at
+        Td(todo[5]),  # created date
         Td(
             Form(
                 Button(
                     "Delete",
                     type="submit", 
                     cls=(ButtonT.destructive, "text-xs"),
-                    onclick="return confirm('Delete this todo?')"
+                    data_confirm="Delete this todo?"
                 ),
                 method="post",
                 action=f"/admin/todos/{todo[0]}/delete",  # todo[0] is id
@@ -196,23 +296,33 @@ def admin_todo_row(todo):
 
 def FilterTabs(current_filter="all", base_url="/admin/todos"):
     """Filter tabs component for todo views"""
+    return NotStr(_filter_tabs_html(current_filter, base_url))
+
+@lru_cache(maxsize=16)
+def _filter_tabs_html(current_filter, base_url):
+    """Serialized FilterTabs markup, one per (current_filter, base_url) pair"""
     filters = [
         ("all", "All Todos"),
         ("pending", "Pending"),
         ("completed", "Completed")
     ]
     
-    return Div(
+    return to_xml(Div(
         *[
             A(
                 label,
                 href=f"{base_url}?filter={filter_key}",
-                cls=f"px-4 py-2 border-b-2 font-medium transition-colors {'border-primary text-primary' if current_filter == filter_key else 'border-transparent text-muted-foreground hover:text-foreground'}"
+                # With HTMX, fetch only the tabs + table and swap them in place
+                hx_get=f"{base_url}/rows?filter={filter_key}",
+                hx_target="#admin-todos",
+                hx_swap="outerHTML",
+                hx_push_url=f"{base_url}?filter={filter_key}",
+                cls=TAB_CLASS[current_filter == filter_key]
             )
             for filter_key, label in filters
         ],
         cls="flex border-b border-border mb-6"
-    )
+    ))
 
 def todo_priority_stats(priority_stats):
     """Display todo statistics by priority"""
@@ -220,8 +330,8 @@ def todo_priority_stats(priority_stats):
         return P("No priority statistics available.", cls="text-muted-foreground")
     
     return Grid(
-        *[StatRow(f"{priority.title()} Priority", count) 
-          for priority, count in priority_stats.items()],
+        *(StatRow(f"{priority.title()} Priority", count)
+          for priority, count in priority_stats.items()),
         cols=1, cls="gap-2"
     )
 
@@ -231,7 +341,7 @@ def recent_todos_activity(activity):
         return P("No recent activity.", cls="text-muted-foreground")
     
     return Div(
-        *[ActivityItem(item) for item in activity[:10]],
+        *map(ActivityItem, activity[:10]),
         cls="space-y-2"
     )
 
@@ -249,8 +359,13 @@ def ActivityItem(item):
     )
 
 def TodoAdminNav(user):
-    """Navigation for todo-specific admin areas"""
-    return NavBar(
+    """Navigation for todo-specific admin areas (the same for every admin, so rendered once)"""
+    return NotStr(_todo_admin_nav_html())
+
+@lru_cache(maxsize=1)
+def _todo_admin_nav_html():
+    """Serialized TodoAdminNav markup"""
+    return to_xml(NavBar(
         A("Dashboard", href="/dashboard"),
         A("Users", href="/auth/admin/users"),        # Built-in admin route
         A("Todos", href="/admin/todos"),             # Custom admin route
@@ -258,7 +373,7 @@ def TodoAdminNav(user):
         A("Profile", href="/auth/profile"),
         A("Logout", href="/auth/logout", cls=ButtonT.secondary),
         brand=A("🔧 Todo Admin", href="/auth/admin")  # Link to built-in admin
-    )
+    ))
 
 def AdminStatsCard(title, value, icon):
     """Admin statistics card"""
@@ -5,6 +5,7 @@ Landing page, about, features, etc.
 
 from fasthtml.common import *
 from monsterui.all import *
+from functools import lru_cache
 
 def register_public_routes(app):
     """Register public routes that don't require authentication"""
@@ -19,19 +20,30 @@ def register_public_routes(app):
             return RedirectResponse('/dashboard', status_code=303)
         
         # Show public landing page
-        return render_landing_page()
+        return cached_page(render_landing_page)
     
+    # The pages only vary by whether someone is logged in, not by who
     @app.route("/about")
     def about(req):
         """About page"""
         user = req.scope.get('user')
-        return render_about_page(user)
+        return cached_page(render_about_page, user is not None)
     
     @app.route("/features")  
     def features(req):
         """Features page"""
         user = req.scope.get('user')
-        return render_features_page(user)
+        return cached_page(render_features_page, user is not None)
+
+@lru_cache(maxsize=8)
+def cached_page(render, *args):
+    """
+    Render a static page once per (render, args) and reuse it
+    Returns the page Title plus the serialized body; the document head is still added per request
+    Serialized without indentation: the pretty-printing whitespace only sits at block boundaries
+    """
+    title, *body = render(*args)
+    return title, NotStr(to_xml(tuple(body), indent=False))
 
 def render_landing_page():
     """Render the public landing page"""
@@ -6,45 +6,152 @@ Updated to use built-in admin navigation
 
 from fasthtml.common import *
 from monsterui.all import *
-from datetime import datetime
+import asyncio
+import hashlib
+import os
+from dataclasses import replace
+from functools import lru_cache
+from html import escape
+import re
+from components import fill_slot, iter_todos_html, slot_template, stream_page_deferred, StreamSlot
+import logging
+
+log = logging.getLogger(__name__)
+
+# Dashboard list page size (rows are fetched one page at a time)
+TODOS_PER_PAGE = 50
+
+# Re-check todo ownership row by row on the dashboard (TODO_AUDIT=1); the SQL
+# WHERE user_id = ? is the real guarantee, so this is off by default
+SECURITY_AUDIT = os.getenv('TODO_AUDIT') == '1'
+
+# Dashboard ETags are derived from the per-user cache version, which restarts at 0
+# with the process, so a per-process seed keeps old ETags from matching after a restart
+ETAG_SEED = os.urandom(8).hex()
+
+# Accepted form values; anything else falls back to 'medium'
+VALID_PRIORITIES = frozenset(('low', 'medium', 'high'))
+
+# Full class strings for todo_item, selected per row instead of formatted per row
+_BADGE = "text-xs px-2 py-1 rounded"
+PRIORITY_CLASS = {
+    'high': f"{_BADGE} text-red-600 bg-red-50",
+    'medium': f"{_BADGE} text-yellow-600 bg-yellow-50",
+    'low': f"{_BADGE} text-green-600 bg-green-50"
+}
+PRIORITY_CLASS_DEFAULT = f"{_BADGE} text-gray-600 bg-gray-50"
+TITLE_CLASS = {
+    True: "text-lg font-medium line-through text-muted-foreground",
+    False: "text-lg font-medium "
+}
+CARD_CLASS = {True: "opacity-60", False: ""}
+_TAB = "px-4 py-2 border-b-2 font-medium transition-colors"
+TAB_CLASS = {
+    True: f"{_TAB} border-primary text-primary",
+    False: f"{_TAB} border-transparent text-muted-foreground hover:text-foreground hover:border-border"
+}
+
+# Priority <select> markup per pre-selected value (None: new todo, nothing selected)
+PRIORITY_SELECT_HTML = {
+    selected: to_xml(Select(
+        Option("Low", value="low", selected=(selected == "low")),
+        Option("Medium", value="medium", selected=(selected == "medium")),
+        Option("High", value="high", selected=(selected == "high")),
+        name="priority",
+        cls="ml-2 w-full",
+    ))
+    for selected in (None, "low", "medium", "high")
+}
+
+# Dashboard ?filter= value -> completed argument for get_todos_by_user
+FILTER_COMPLETED = {'all': None, 'pending': False, 'completed': True}
+
+# The dashboard reads its two parameters straight from the raw query string,
+# skipping the query_params MultiDict
+FILTER_PARAM_RE = re.compile(rb"(?:^|&)filter=([^&]*)")
+PAGE_PARAM_RE = re.compile(rb"(?:^|&)page=(\d+)(?:&|$)")
+# Longer page numbers are past any real last page (and int() refuses very long ones),
+# so they are read as this; it still keeps OFFSET inside SQLite's 64-bit integers
+MAX_PAGE = 999_999_999
+
+EMPTY_STATE_MESSAGES = {
+    'all': "You haven't created any todos yet.",
+    'completed': "No completed todos found.",
+    'pending': "No pending todos found."
+}
 
 def register_todo_routes(app, auth, todo_db):
     """Register protected todo routes with enhanced security"""
     
     @app.route("/dashboard")
-    def dashboard(req):
+    async def dashboard(req):
         """Main user dashboard with todos - SECURITY HARDENED"""
         user = req.scope['user']
-        filter_type = req.query_params.get('filter', 'all')
+        query = req.scope.get('query_string', b'')
+        match = FILTER_PARAM_RE.search(query)
+        filter_type = match.group(1).decode('latin-1') if match else 'all'
+        if filter_type not in FILTER_COMPLETED:
+            filter_type = 'all'
+        match = PAGE_PARAM_RE.search(query)
+        digits = match.group(1) if match else b'1'
+        page = max(int(digits), 1) if len(digits) <= 9 else MAX_PAGE
         
         # DEBUG: Log dashboard access
-        print(f"DEBUG: Dashboard accessed by user_id={user.id}, username={user.username}, role={user.role}")
-        
-        # Get todos based on filter - SECURITY: Only user's own todos
-        if filter_type == 'completed':
-            todos = todo_db.get_todos_by_user(user.id, completed=True)
-        elif filter_type == 'pending':  
-            todos = todo_db.get_todos_by_user(user.id, completed=False)
-        else:
-            todos = todo_db.get_todos_by_user(user.id)
-        
-        # DEBUG: Log todo retrieval
-        print(f"DEBUG: User {user.id} retrieved {len(todos)} todos (filter={filter_type})")
+        log.debug("Dashboard accessed by user_id=%s, username=%s, role=%s", user.id, user.username, user.role)
         
-        # SECURITY AUDIT: Verify all todos belong to current user
-        security_violations = []
-        for todo in todos:
-            if todo.user_id != user.id:
-                security_violations.append(f"Todo {todo.id} owned by {todo.user_id}")
+        # The page only changes when the user writes a todo, so a browser re-fetch
+        # whose ETag still matches gets a bodyless 304
+        etag = dashboard_etag(req, user, todo_db.cache.version(user.id))
+        if etag in req.headers.get('if-none-match', ''):
+            return Response(status_code=304, headers={'ETag': etag})
         
-        if security_violations:
-            print(f"🚨 CRITICAL SECURITY VIOLATIONS: {security_violations}")
-            # In production, you might want to log this to security logs and potentially block the request
+        # Get todos based on filter - SECURITY: Only user's own todos
+        completed = FILTER_COMPLETED[filter_type]
         
-        # Get user statistics
-        stats = todo_db.get_user_stats(user.id)
+        async def content():
+            # The rendered content is cached per user until their next write
+            # (the username is in the key because it is shown in the header)
+            # The key is taken before any read, so a write during the reads leaves
+            # the stored render under an already stale version
+            cache_key, html = todo_db.cache.lookup(user.id, ('dashboard', filter_type, page, user.username))
+            if html is not None:
+                return html, ()
+            
+            # The todo page and the user statistics are independent reads, so they run
+            # concurrently on separate pooled connections
+            todos, stats = await asyncio.gather(
+                asyncio.to_thread(todo_db.get_todos_by_user, user.id, completed=completed,
+                                  limit=TODOS_PER_PAGE, offset=(page - 1) * TODOS_PER_PAGE),
+                asyncio.to_thread(todo_db.get_user_stats, user.id)
+            )
+            # A page past the end shows the last page (one more read, only for such URLs)
+            shown_page = min(page, dashboard_page_count(stats, filter_type))
+            if shown_page != page:
+                todos = await asyncio.to_thread(todo_db.get_todos_by_user, user.id, completed=completed,
+                                                limit=TODOS_PER_PAGE, offset=(shown_page - 1) * TODOS_PER_PAGE)
+            
+            # DEBUG: Log todo retrieval
+            log.debug("User %s retrieved %s todos (filter=%s)", user.id, len(todos), filter_type)
+            
+            # SECURITY AUDIT: Verify all todos belong to current user
+            if SECURITY_AUDIT:
+                security_violations = [f"Todo {todo.id} owned by {todo.user_id}"
+                                       for todo in todos if todo.user_id != user.id]
+                if security_violations:
+                    log.warning("CRITICAL SECURITY VIOLATIONS: %s", security_violations)
+                    # In production, you might want to log this to security logs and potentially block the request
+            
+            html = fill_slot(render_dashboard(user, todos, stats, filter_type, shown_page), iter_todos_html(todos, todo_item))
+            # Past-the-end pages are not cached, so arbitrary page numbers cannot fill the cache
+            if shown_page == page:
+                todo_db.cache.store(cache_key, html)
+            return html, ()
         
-        return render_dashboard(user, todos, stats, filter_type)
+        # The head and nav go out before the reads; the todo rows are streamed in after them
+        response = stream_page_deferred(req, dashboard_shell(user), content)
+        # no-cache, not max-age: the redirect after a write must never show a stale list
+        response.headers.update({'ETag': etag, 'Cache-Control': 'private, no-cache'})
+        return response
     
     @app.route("/todos/new", methods=["GET"])
     def new_todo_form(req):
@@ -56,18 +163,15 @@ def register_todo_routes(app, auth, todo_db):
     async def create_todo(req):
         """Create a new todo - SECURITY: Uses current user's ID"""
         user = req.scope['user']
-        form = await req.form()
-        
-        title = form.get('title', '').strip()
-        description = form.get('description', '').strip()
-        priority = form.get('priority', 'medium')
-        due_date = form.get('due_date', '') or None
+        title, description, priority, due_date = parse_todo_form(await req.form())
         
         if not title:
             return render_todo_form(user, error="Title is required")
         
         # SECURITY: Always create todo with current user's ID
-        todo = todo_db.create_todo(
+        # Async handler: run the write off the event loop, as the dashboard does for reads
+        todo = await asyncio.to_thread(
+            todo_db.create_todo,
             user_id=user.id,  # CRITICAL: Use authenticated user's ID
             title=title,
             description=description,
@@ -76,7 +180,7 @@ def register_todo_routes(app, auth, todo_db):
         )
         
         if todo:
-            print(f"DEBUG: User {user.id} created todo {todo.id}: '{title[:30]}...'")
+            log.debug("User %s created todo %s: '%.30s...'", user.id, todo.id, title)
             return RedirectResponse('/dashboard?success=created', status_code=303)
         else:
             return render_todo_form(user, error="Failed to create todo")
@@ -89,7 +193,7 @@ def register_todo_routes(app, auth, todo_db):
         todo = todo_db.get_todo_by_id(todo_id, user.id)
         
         if not todo:
-            print(f"SECURITY: User {user.id} blocked from editing todo {todo_id} (not found or not owned)")
+            log.warning("SECURITY: User %s blocked from editing todo %s (not found or not owned)", user.id, todo_id)
             return RedirectResponse('/dashboard?error=not_found', status_code=303)
         
         return render_todo_form(user, todo=todo)
@@ -98,24 +202,24 @@ def register_todo_routes(app, auth, todo_db):
     async def update_todo(req, todo_id: int):
         """Update an existing todo - SECURITY HARDENED"""
         user = req.scope['user']
-        # SECURITY: Verify ownership before allowing edit
-        todo = todo_db.get_todo_by_id(todo_id, user.id)
+        title, description, priority, due_date = parse_todo_form(await req.form())
         
-        if not todo:
-            print(f"SECURITY: User {user.id} blocked from updating todo {todo_id} (not found or not owned)")
-            return RedirectResponse('/dashboard?error=not_found', status_code=303)
-        
-        form = await req.form()
-        title = form.get('title', '').strip()
-        description = form.get('description', '').strip()
-        priority = form.get('priority', 'medium')
-        due_date = form.get('due_date', '') or None
+        async def refill_form(error):
+            # SECURITY: Verify ownership before showing the form again
+            todo = await asyncio.to_thread(todo_db.get_todo_by_id, todo_id, user.id)
+            if not todo:
+                log.warning("SECURITY: User %s blocked from updating todo %s (not found or not owned)", user.id, todo_id)
+                return RedirectResponse('/dashboard?error=not_found', status_code=303)
+            # Keep what the user typed rather than the stored values
+            submitted = replace(todo, title=title, description=description, priority=priority, due_date=due_date)
+            return render_todo_form(user, todo=submitted, error=error)
         
         if not title:
-            return render_todo_form(user, todo=todo, error="Title is required")
+            return await refill_form("Title is required")
         
-        # SECURITY: update_todo now requires user_id verification
-        success = todo_db.update_todo_secure(
+        # SECURITY: The update is scoped to the user's own todo, so no separate ownership fetch is needed
+        success = await asyncio.to_thread(
+            todo_db.update_todo_secure,
             todo_id,
             user.id,  # ADDED: User ID verification
             title=title,
@@ -125,37 +229,39 @@ def register_todo_routes(app, auth, todo_db):
         )
         
         if success:
-            print(f"DEBUG: User {user.id} updated todo {todo_id}")
+            log.debug("User %s updated todo %s", user.id, todo_id)
             return RedirectResponse('/dashboard?success=updated', status_code=303)
         else:
-            return render_todo_form(user, todo=todo, error="Failed to update todo")
+            # False is either "no such owned todo" or a swallowed write error: the ownership
+            # check tells them apart, and a failed write keeps the user's edits
+            return await refill_form("Failed to update todo")
     
     @app.route("/todos/{todo_id:int}/toggle", methods=["POST"])
-    def toggle_todo(req, todo_id: int):
+    async def toggle_todo(req, todo_id: int):
         """Toggle todo completion status - SECURITY HARDENED"""
         user = req.scope['user']
         # SECURITY: toggle_todo_completion verifies user ownership
-        success = todo_db.toggle_todo_completion(todo_id, user.id)
+        completed = await asyncio.to_thread(todo_db.toggle_todo_completion, todo_id, user.id)
         
-        if success:
-            print(f"DEBUG: User {user.id} toggled todo {todo_id}")
+        if completed is not None:
+            log.debug("User %s toggled todo %s", user.id, todo_id)
             return RedirectResponse('/dashboard?success=toggled', status_code=303)
         else:
-            print(f"SECURITY: User {user.id} blocked from toggling todo {todo_id}")
+            log.warning("SECURITY: User %s blocked from toggling todo %s", user.id, todo_id)
             return RedirectResponse('/dashboard?error=toggle_failed', status_code=303)
     
     @app.route("/todos/{todo_id:int}/delete", methods=["POST"])
-    def delete_todo(req, todo_id: int):
+    async def delete_todo(req, todo_id: int):
         """Delete a todo - SECURITY HARDENED"""
         user = req.scope['user']
         # SECURITY: delete_todo has multi-layer ownership verification
-        success = todo_db.delete_todo(todo_id, user.id)
+        success = await asyncio.to_thread(todo_db.delete_todo, todo_id, user.id)
         
         if success:
-            print(f"DEBUG: User {user.id} deleted todo {todo_id}")
+            log.debug("User %s deleted todo %s", user.id, todo_id)
             return RedirectResponse('/dashboard?success=deleted', status_code=303)
         else:
-            print(f"SECURITY: User {user.id} blocked from deleting todo {todo_id}")
+            log.warning("SECURITY: User %s blocked from deleting todo %s", user.id, todo_id)
             return RedirectResponse('/dashboard?error=delete_failed', status_code=303)
     
     # DEBUG ROUTE - Remove in production
@@ -198,43 +304,67 @@ def register_todo_routes(app, auth, todo_db):
         
         return debug_html
 
-def render_dashboard(user, todos, stats, filter_type='all'):
-    """Render the main dashboard - SECURITY: Only shows user's todos"""
-    return Title("Dashboard - My Todos"), \
-        DashboardNav(user), \
-        Container(
-            # Dashboard Header
-            DivFullySpaced(
-                Div(
-                    H1(f"Welcome back, {user.username}!", cls="text-3xl font-bold"),
-                    P(f"You have {stats['pending']} pending todos", cls="text-muted-foreground")
-                ),
-                A("New Todo", href="/todos/new", cls=(ButtonT.primary, "mb-4", "text-l px-5 py-2"))
-            ),
-            
-            # Statistics Cards
-            Grid(
-                StatsCard("Total Todos", stats['total'], "📝"),
-                StatsCard("Completed", stats['completed'], "✅"),
-                StatsCard("Pending", stats['pending'], "⏳"),
-                StatsCard("Completion Rate", f"{stats['completion_rate']:.0%}", "📊"),
-                cols=2, cols_md=4, cls="gap-4 mb-4"
-            ),
-            
-            # Filter Tabs
-            TabsContainer(
-                Tab("All", f"/dashboard?filter=all", active=(filter_type=='all')),
-                Tab("Pending", f"/dashboard?filter=pending", active=(filter_type=='pending')),
-                Tab("Completed", f"/dashboard?filter=completed", active=(filter_type=='completed'))
+def parse_todo_form(form):
+    """Validated (title, description, priority, due_date) from a submitted todo form (title may be empty)"""
+    priority = form.get('priority', 'medium')
+    return (
+        form.get('title', '').strip(),
+        form.get('description', '').strip(),
+        priority if priority in VALID_PRIORITIES else 'medium',
+        form.get('due_date', '') or None
+    )
+
+def dashboard_etag(req, user, version):
+    """Weak ETag for a dashboard response: user, cache version and everything else the markup depends on"""
+    key = "|".join(map(str, (
+        ETAG_SEED, user.id, user.username, user.role, *version,
+        req.scope.get('query_string', b'').decode('latin-1'),
+        req.headers.get('hx-request'), req.headers.get('hx-history-restore-request')
+    )))
+    return f'W/"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"'
+
+def dashboard_shell(user):
+    """Dashboard title and nav, with a slot for the content from render_dashboard"""
+    return Title("Dashboard - My Todos"), DashboardNav(user), StreamSlot()
+
+def dashboard_page_count(stats, filter_type):
+    """Number of dashboard pages for a filter (at least 1)"""
+    # Page count comes from the (cached) stats, so no extra COUNT query is needed
+    filtered_total = stats[filter_type] if filter_type in ('completed', 'pending') else stats['total']
+    return max(-(-filtered_total // TODOS_PER_PAGE), 1)
+
+def render_dashboard(user, todos, stats, filter_type='all', page=1):
+    """Render the main dashboard content - SECURITY: Only shows user's todos"""
+    page_count = dashboard_page_count(stats, filter_type)
+    return Container(
+        # Dashboard Header
+        DivFullySpaced(
+            Div(
+                H1(f"Welcome back, {user.username}!", cls="text-3xl font-bold"),
+                P(f"You have {stats['pending']} pending todos", cls="text-muted-foreground")
             ),
-            
-            # Todos List
-            todos_section(todos) if todos else empty_state(filter_type),
-            
-            cls=ContainerT.xl
-        )
+            A("New Todo", href="/todos/new", cls=(ButtonT.primary, "mb-4", "text-l px-5 py-2"))
+        ),
+        
+        # Statistics Cards
+        Grid(
+            StatsCard("Total Todos", stats['total'], "📝"),
+            StatsCard("Completed", stats['completed'], "✅"),
+            StatsCard("Pending", stats['pending'], "⏳"),
+            StatsCard("Completion Rate", f"{stats['completion_rate']:.0%}", "📊"),
+            cols=2, cols_md=4, cls="gap-4 mb-4"
+        ),
+        
+        # Filter Tabs
+        FilterTabs(filter_type),
+        
+        # Todos List
+        todos_section(todos, Pager(filter_type, page, page_count)) if todos else empty_state(filter_type),
+        
+        cls=ContainerT.xl
+    )
 
-def todos_section(todos):
+def todos_section(todos, pager=None):
     """Render todos list section"""
     return Card(
         CardHeader(
@@ -242,22 +372,18 @@ def todos_section(todos):
         ),
         CardBody(
             Div(
-                *[todo_item(todo) for todo in todos],
+                # Rows are streamed here by the dashboard route (see stream_page)
+                StreamSlot(),
                 cls="space-y-1"
-            )
+            ),
+            pager
         ),
         cls="mt-1"
     )
 
 def todo_item(todo):
     """Render individual todo item - SECURITY: Only shows if ownership verified"""
-    priority_colors = {
-        'high': 'text-red-600 bg-red-50',
-        'medium': 'text-yellow-600 bg-yellow-50', 
-        'low': 'text-green-600 bg-green-50'
-    }
-    
-    priority_class = priority_colors.get(todo.priority, 'text-gray-600 bg-gray-50')
+    completed = bool(todo.completed)
     
     return Card(
         CardBody(
@@ -268,11 +394,11 @@ def todo_item(todo):
                         Div(
                             H3(
                                 todo.title, 
-                                cls=f"text-lg font-medium {'line-through text-muted-foreground' if todo.completed else ''}"
+                                cls=TITLE_CLASS[completed]
                             ),
                             P(todo.description, cls="text-sm text-muted-foreground") if todo.description else None,
                             Div(
-                                Span(todo.priority.title(), cls=f"text-xs px-2 py-1 rounded {priority_class}"),
+                                Span(todo.priority.title(), cls=PRIORITY_CLASS.get(todo.priority, PRIORITY_CLASS_DEFAULT)),
                                 Span(f"Due: {todo.due_date}", cls="text-xs text-muted-foreground") if todo.due_date else None,
                                 cls="flex items-center gap-2 mt-1"
                             )
@@ -293,7 +419,7 @@ def todo_item(todo):
                             A("Edit", href=f"/todos/{todo.id}/edit", cls=(ButtonT.secondary, "w-16 h-8 inline-flex items-center justify-center")),
                             Form(
                                 Button("Delete", type="submit", cls=(ButtonT.destructive, "w-16 h-8"),
-                                      onclick="return confirm('Delete this todo?')"),
+                                      data_confirm="Delete this todo?"),
                                 method="post",
                                 action=f"/todos/{todo.id}/delete",
                                 style="display: inline"
@@ -305,138 +431,178 @@ def todo_item(todo):
                 )
             )
         ),
-        cls=f"{'opacity-60' if todo.completed else ''}"
+        cls=CARD_CLASS[completed]
     )
 
 def empty_state(filter_type):
-    """Render empty state when no todos"""
-    messages = {
-        'all': "You haven't created any todos yet.",
-        'completed': "No completed todos found.",
-        'pending': "No pending todos found."
-    }
-    
-    return Card(
+    """Render empty state when no todos (the same for every user, so serialized once per filter)"""
+    return NotStr(_empty_state_html(filter_type if filter_type in EMPTY_STATE_MESSAGES else 'all'))
+
+@lru_cache(maxsize=4)
+def _empty_state_html(filter_type):
+    """Serialized empty_state markup"""
+    return to_xml(Card(
         CardBody(
             DivCentered(
                 Div(
                     H3("📝", cls="text-6xl mb-4"),
                     H3("No Todos Found", cls="text-xl font-semibold mb-2"),
-                    P(messages.get(filter_type, messages['all']), cls="text-muted-foreground mb-4"),
+                    P(EMPTY_STATE_MESSAGES[filter_type], cls="text-muted-foreground mb-4"),
                     A("Create Your First Todo", href="/todos/new", cls=ButtonT.primary) if filter_type == 'all' else None,
                     cls="text-center py-12"
                 )
             )
         ),
         cls="mt-6"
-    )
+    ))
 
 def render_todo_form(user, todo=None, error=None):
     """Render todo create/edit form"""
     is_edit = todo is not None
+    # The blank create form is the same for every user, so it is serialized once
+    body = todo_form_body(todo, error) if is_edit or error else _new_todo_form_html()
+    return Title(f"{'Edit' if is_edit else 'New'} Todo"), DashboardNav(user), body
+
+@lru_cache(maxsize=1)
+def _new_todo_form_html():
+    return NotStr(to_xml(todo_form_body(), indent=False))
+
+def todo_form_body(todo=None, error=None):
+    """Create/edit form card (no title or nav)"""
+    is_edit = todo is not None
     action = f"/todos/{todo.id}/edit" if is_edit else "/todos/new"
     
-    return Title(f"{'Edit' if is_edit else 'New'} Todo"), \
-        DashboardNav(user), \
-        Container(
-            Card(
-                CardHeader(
-                    DivFullySpaced(
-                        H1(f"{'Edit' if is_edit else 'Create'} Todo", cls="text-2xl font-bold"),
-                        A("← Back to Dashboard", href="/dashboard", cls=ButtonT.secondary)
-                    )
-                ),
-                CardBody(
-                    Alert(error, cls=AlertT.error) if error else None,
-                    
-                    Form(
-                        LabelInput(
-                            "Title",
-                            name="title",
-                            value=todo.title if is_edit else "",
-                            placeholder="What needs to be done?",
-                            required=True,
-                            autofocus=True
-                        ),
-                        Div(
-                            Label(
-                                "Description", cls="block text-sm font-medium mb-1"),
-                            Textarea(
-                                todo.description if is_edit else "",
-                                name="description", 
-                                placeholder="Add more details (optional)",
-                                rows=3,
-                                cls="w-full block ml-2"
-                            )
-                        ),
-                        Grid(
-                            Label(
-                                "Priority",
-                                Select(
-                                    Option("Low", value="low", selected=(is_edit and todo.priority=="low")),
-                                    Option("Medium", value="medium", selected=(is_edit and todo.priority=="medium")),
-                                    Option("High", value="high", selected=(is_edit and todo.priority=="high")),
-                                    name="priority",
-                                    cls="ml-2 w-full",
-                                ),
-                                cls="text-sm font-medium mb-1"
-                            ),
-                            LabelInput(
-                                "Due Date",
-                                name="due_date",
-                                type="date",
-                                value=todo.due_date if is_edit and todo.due_date else ""
-                            ),
-                            cols=1, cols_md=2, cls="gap-4"
+    return Container(
+        Card(
+            CardHeader(
+                DivFullySpaced(
+                    H1(f"{'Edit' if is_edit else 'Create'} Todo", cls="text-2xl font-bold"),
+                    A("← Back to Dashboard", href="/dashboard", cls=ButtonT.secondary)
+                )
+            ),
+            CardBody(
+                Alert(error, cls=AlertT.error) if error else None,
+                
+                Form(
+                    LabelInput(
+                        "Title",
+                        name="title",
+                        value=todo.title if is_edit else "",
+                        placeholder="What needs to be done?",
+                        required=True,
+                        autofocus=True
+                    ),
+                    Div(
+                        Label(
+                            "Description", cls="block text-sm font-medium mb-1"),
+                        Textarea(
+                            todo.description if is_edit else "",
+                            name="description", 
+                            placeholder="Add more details (optional)",
+                            rows=3,
+                            cls="w-full block ml-2"
+                        )
+                    ),
+                    Grid(
+                        Label(
+                            "Priority",
+                            NotStr(PRIORITY_SELECT_HTML.get(todo.priority if is_edit else None,
+                                                            PRIORITY_SELECT_HTML[None])),
+                            cls="text-sm font-medium mb-1"
                         ),
-                        
-                        DivRAligned(
-                            Button(f"{'Update' if is_edit else 'Create'} Todo", type="submit", cls=ButtonT.primary),
-                            cls="mt-6"
+                        LabelInput(
+                            "Due Date",
+                            name="due_date",
+                            type="date",
+                            value=todo.due_date if is_edit and todo.due_date else ""
                         ),
-                        
-                        method="post",
-                        action=action
-                    )
-                ),
-                cls="max-w-2xl mx-auto mt-8"
+                        cols=1, cols_md=2, cls="gap-4"
+                    ),
+                    
+                    DivRAligned(
+                        Button(f"{'Update' if is_edit else 'Create'} Todo", type="submit", cls=ButtonT.primary),
+                        cls="mt-6"
+                    ),
+                    
+                    method="post",
+                    action=action
+                )
             ),
-            cls=ContainerT.xl
-        )
+            cls="max-w-2xl mx-auto mt-8"
+        ),
+        cls=ContainerT.xl
+    )
 
 def DashboardNav(user):
     """Navigation bar for dashboard - Updated to use built-in admin"""
+    # Only the role changes the structure, so the nav is rendered once per role
+    return NotStr(_dashboard_nav_template(user.role) % {'username': escape(user.username)})
+
+@lru_cache(maxsize=4)
+def _dashboard_nav_template(role):
+    """DashboardNav markup for `role`, as a %-format string with a username slot"""
     nav_items = [
         A("Dashboard", href="/dashboard"),
         A("Profile", href="/auth/profile"),
     ]
     
     # Add admin link for admin users - now points to built-in admin
-    if user.role == 'admin':
+    if role == 'admin':
         nav_items.append(A("Admin", href="/auth/admin"))  # Updated to built-in admin
     
     nav_items.append(A("Logout", href="/auth/logout", cls=ButtonT.secondary))
     
-    return NavBar(
+    return slot_template(NavBar(
         *nav_items,
-        brand=A(f"📝 Welcome, {user.username}", href="/dashboard")
-    )
+        brand=A("📝 Welcome, __SLOT_username__", href="/dashboard")
+    ))
 
 def StatsCard(title, value, icon):
     """Statistics card component"""
-    return Card(
+    return NotStr(_stats_card_template() % {
+        'icon': escape(icon), 'title': escape(title), 'value': escape(str(value))
+    })
+
+@lru_cache(maxsize=1)
+def _stats_card_template():
+    """StatsCard markup rendered once, as a %-format string with icon/title/value slots"""
+    return slot_template(Card(
         CardBody(
             DivCentered(
                 Div(
-                    Div(icon, cls="text-2xl mb-2"),
-                    P(title, cls="text-sm text-muted-foreground"),
-                    P(str(value), cls="text-2xl font-bold"),
+                    Div("__SLOT_icon__", cls="text-2xl mb-2"),
+                    P("__SLOT_title__", cls="text-sm text-muted-foreground"),
+                    P("__SLOT_value__", cls="text-2xl font-bold"),
                     cls="text-center"
                 )
             )
         )
+    ))
+
+def Pager(filter_type, page, page_count):
+    """Newer / older links under the todo list (None when everything fits on one page)"""
+    if page_count <= 1:
+        return None
+    base = f"/dashboard?filter={filter_type}&page="
+    return DivFullySpaced(
+        A("← Newer", href=f"{base}{page - 1}", cls=ButtonT.ghost) if page > 1 else Span(),
+        Span(f"Page {page} of {page_count}", cls="text-sm text-muted-foreground"),
+        A("Older →", href=f"{base}{page + 1}", cls=ButtonT.ghost) if page < page_count else Span(),
+        cls="mt-4"
     )
 
+def FilterTabs(filter_type):
+    """Dashboard filter tabs - one of three fixed variants, each serialized once"""
+    return NotStr(_filter_tabs_html(filter_type))
+
+@lru_cache(maxsize=4)
+def _filter_tabs_html(filter_type):
+    return to_xml(TabsContainer(
+        Tab("All", f"/dashboard?filter=all", active=(filter_type=='all')),
+        Tab("Pending", f"/dashboard?filter=pending", active=(filter_type=='pending')),
+        Tab("Completed", f"/dashboard?filter=completed", active=(filter_type=='completed'))
+    ), indent=False)
+
 def TabsContainer(*tabs):
     """Tab container for filtering"""
     return Div(
@@ -449,5 +615,5 @@ def Tab(label, href, active=False):
     return A(
         label,
         href=href,
-        cls=f"px-4 py-2 border-b-2 font-medium transition-colors {'border-primary text-primary' if active else 'border-transparent text-muted-foreground hover:text-foreground hover:border-border'}"
+        cls=TAB_CLASS[active]
     )
\ No newline at end of file
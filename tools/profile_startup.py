@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Startup Profiling Harness
+Times a cold `create_app()` in a fresh interpreter and fails if it exceeds a budget
+Optionally records Scalene / py-spy profiles when those tools are installed
+
+Usage:
+    python tools/profile_startup.py                 # timing + budget check only
+    python tools/profile_startup.py --profile       # also write startup.json / flame.svg
+    STARTUP_BUDGET=3.0 python tools/profile_startup.py
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+BUDGET_SECONDS = float(os.getenv('STARTUP_BUDGET', '2.5'))
+RUNS = int(os.getenv('STARTUP_RUNS', '3'))
+
+# Imports app.py and builds the app (app.app calls create_app on first access), reporting elapsed wall time
+TIMING_SNIPPET = """
+import time
+start = time.perf_counter()
+import app
+app.app
+print(f"STARTUP_SECONDS={time.perf_counter() - start:.4f}")
+"""
+
+CREATE_APP_SNIPPET = "import app; app.app"
+
+def run_cold_start(workdir: Path) -> float:
+    """Run one cold start in a fresh interpreter and return elapsed seconds"""
+    result = subprocess.run(
+        [sys.executable, "-c", TIMING_SNIPPET],
+        cwd=workdir, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stdout)
+        print(result.stderr, file=sys.stderr)
+        raise RuntimeError("create_app() failed during startup timing")
+
+    for line in result.stdout.splitlines():
+        if line.startswith("STARTUP_SECONDS="):
+            return float(line.split("=", 1)[1])
+    raise RuntimeError("Timing output not found")
+
+def record_profiles(workdir: Path):
+    """Write Scalene JSON and py-spy flamegraph output if the tools are available"""
+    if shutil.which("scalene"):
+        print("📊 Recording Scalene profile -> startup.json")
+        subprocess.run(
+            ["scalene", "--cli", "--json", "--outfile", str(ROOT_DIR / "startup.json"),
+             "---", sys.executable, "-c", CREATE_APP_SNIPPET],
+            cwd=workdir
+        )
+    else:
+        print("ℹ️  scalene not installed - skipping")
+
+    if shutil.which("py-spy"):
+        print("🔥 Recording py-spy flamegraph -> flame.svg")
+        subprocess.run(
+            ["py-spy", "record", "-o", str(ROOT_DIR / "flame.svg"), "--",
+             sys.executable, "-c", CREATE_APP_SNIPPET],
+            cwd=workdir
+        )
+    else:
+        print("ℹ️  py-spy not installed - skipping")
+
+def main():
+    """Time cold starts against a throwaway copy of the app and enforce the budget"""
+    with tempfile.TemporaryDirectory() as tmp:
+        # Work on a copy so profiling never touches the real data/ directory
+        workdir = Path(tmp) / "app"
+        shutil.copytree(ROOT_DIR, workdir, ignore=shutil.ignore_patterns("data", ".git", "__pycache__"))
+
+        # First run creates the database; subsequent runs measure a warm-disk cold start
+        timings = [run_cold_start(workdir) for _ in range(RUNS + 1)][1:]
+        best = min(timings)
+
+        print(f"⏱️  create_app() cold start: best {best:.3f}s over {RUNS} runs "
+              f"({', '.join(f'{t:.3f}' for t in timings)})")
+        print(f"🎯 Budget: {BUDGET_SECONDS:.3f}s")
+
+        if "--profile" in sys.argv:
+            record_profiles(workdir)
+
+    if best > BUDGET_SECONDS:
+        print("❌ Startup time over budget")
+        sys.exit(1)
+
+    print("✅ Startup time within budget")
+
+if __name__ == "__main__":
+    main()